@@ -152,13 +152,20 @@ class Settings(BaseSettings):
     
     @property
     def ethereum_http_url(self) -> str:
-        """Construit l'URL HTTP Ethereum."""
+        """Construit l'URL HTTP Ethereum (endpoint prioritaire)."""
+        return self.ethereum_http_urls[0]
+    
+    @property
+    def ethereum_http_urls(self) -> List[str]:
+        """Liste toutes les URLs HTTP Ethereum configurées (pour le failover)."""
+        urls = []
         if self.ALCHEMY_API_KEY:
-            return f"https://eth-{self.ETHEREUM_NETWORK}.g.alchemy.com/v2/{self.ALCHEMY_API_KEY}"
-        elif self.INFURA_PROJECT_ID:
-            return f"https://{self.ETHEREUM_NETWORK}.infura.io/v3/{self.INFURA_PROJECT_ID}"
-        else:
+            urls.append(f"https://eth-{self.ETHEREUM_NETWORK}.g.alchemy.com/v2/{self.ALCHEMY_API_KEY}")
+        if self.INFURA_PROJECT_ID:
+            urls.append(f"https://{self.ETHEREUM_NETWORK}.infura.io/v3/{self.INFURA_PROJECT_ID}")
+        if not urls:
             raise ValueError("Either ALCHEMY_API_KEY or INFURA_PROJECT_ID is required")
+        return urls
     
     @property
     def is_production(self) -> bool:
@@ -254,6 +261,37 @@ ERC20_ABI = [
 UNISWAP_V2_FACTORY_ADDRESS = "0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"
 UNISWAP_V3_FACTORY_ADDRESS = "0x1F98431c8aD98523631AE4a59f267346ea31F984"
 
+# Multicall3 (même adresse sur mainnet et les testnets) pour regrouper les eth_call
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
 # Adresses de tokens stables pour calculs de liquidité
 STABLE_TOKENS = {
     "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
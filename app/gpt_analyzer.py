@@ -25,6 +25,12 @@ from app.models import (
 )
 from app.utils.logger import setup_logger
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = setup_logger(__name__)
 
 
@@ -229,7 +235,7 @@ Recommandations possibles: BUY (score ≥ 7), HOLD (score 5-6.9), AVOID (score <
             model_used = ai_result.get("model", self.model)
             
             # Parser le JSON
-            data = json.loads(content)
+            data = _loads(content)
             
             # Validation des champs obligatoires
             required_fields = ["score", "reasoning", "recommendation", "confidence"]
@@ -276,7 +282,7 @@ Recommandations possibles: BUY (score ≥ 7), HOLD (score 5-6.9), AVOID (score <
             
             return analysis
             
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError en hérite
             logger.error(f"Erreur de parsing JSON: {e}")
             logger.error(f"Contenu reçu: {ai_result.get('content', '')[:200]}...")
             return None
@@ -331,13 +337,11 @@ Recommandations possibles: BUY (score ≥ 7), HOLD (score 5-6.9), AVOID (score <
     
     def _calculate_liquidity_ratio(self, token_info: TokenInfo) -> float:
         """Calcule le ratio liquidité/market cap."""
-        if not token_info.liquidity_usd or not token_info.market_cap_usd:
-            return 0.0
-        
-        if token_info.market_cap_usd == 0:
-            return 0.0
+        liquidity = token_info.liquidity_usd
+        market_cap = token_info.market_cap_usd
         
-        return token_info.liquidity_usd / token_info.market_cap_usd
+        # None et 0 sont tous deux falsy: un seul test couvre la division par zéro
+        return liquidity / market_cap if liquidity and market_cap else 0.0
     
     def _format_number(self, value: Optional[float]) -> str:
         """Formate un nombre pour l'affichage."""
@@ -15,53 +15,64 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
-from web3.exceptions import ContractLogicError, BadFunctionCallOutput
-from eth_utils import to_checksum_address
+from eth_abi import decode as abi_decode
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
 
-from .config import get_settings
+from .config import get_settings, MULTICALL3_ADDRESS, MULTICALL3_ABI
 from .models import TokenInfo, SocialMetrics
 from .utils.logger import get_logger
 from .utils.validators import is_valid_ethereum_address, validate_token_metadata
 
-# ERC20 ABI for basic token functions
-ERC20_ABI = [
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "name",
-        "outputs": [{"name": "", "type": "string"}],
-        "type": "function"
-    },
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "symbol",
-        "outputs": [{"name": "", "type": "string"}],
-        "type": "function"
-    },
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "decimals",
-        "outputs": [{"name": "", "type": "uint8"}],
-        "type": "function"
-    },
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "totalSupply",
-        "outputs": [{"name": "", "type": "uint256"}],
-        "type": "function"
-    },
-    {
-        "constant": True,
-        "inputs": [{"name": "_owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "balance", "type": "uint256"}],
-        "type": "function"
-    }
-]
+# ERC20 getters batched into one Multicall3 call: (function, selector, output type, fallback value).
+# Argument-less calls reduce to their 4-byte selector, computed once at import
+ERC20_BASIC_FIELDS = tuple(
+    (fn_name, function_signature_to_4byte_selector(f"{fn_name}()"), output_type, default)
+    for fn_name, output_type, default in (
+        ("name", "string", "Unknown"),
+        ("symbol", "string", "UNKNOWN"),
+        ("decimals", "uint8", 18),
+        ("totalSupply", "uint256", 0),
+    )
+)
+
+# Keep-alive pool shared by every JSON-RPC call made through web3
+RPC_POOL_CONNECTIONS = 16
+RPC_POOL_MAXSIZE = 64
+RPC_TIMEOUT = 10
+
+
+def _build_rpc_session() -> requests.Session:
+    """Build a pooled keep-alive session for the Web3 HTTP provider.
+    
+    This session's urllib3 Retry is the only retry layer: the provider's own
+    http_retry_request middleware (5 attempts) is removed in initialize(), so
+    a dead endpoint costs at most 3 attempts instead of 3 x 5.
+    
+    JSON-RPC goes over POST, which urllib3 does not retry by default; the
+    scanner only issues read calls, so retrying them is safe.
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False  # hand the last response to web3, which raises HTTPError
+    )
+    adapter = HTTPAdapter(
+        pool_connections=RPC_POOL_CONNECTIONS,
+        pool_maxsize=RPC_POOL_MAXSIZE,
+        max_retries=retry
+    )
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Content-Type": "application/json", "Accept-Encoding": "gzip"})
+    return session
 
 @dataclass
 class MarketData:
@@ -81,6 +92,8 @@ class TokenScannerService:
         self.settings = get_settings()
         self.logger = get_logger("token_scanner")
         self.web3 = None
+        self.multicall = None
+        self.rpc_session = None
         self.http_client = None
         self._cache = {}
         self._cache_ttl = 300  # 5 minutes
@@ -101,12 +114,21 @@ class TokenScannerService:
         try:
             # Initialize Web3 connection
             if self.settings.ethereum_rpc_url:
-                self.web3 = Web3(Web3.HTTPProvider(self.settings.ethereum_rpc_url))
+                self.rpc_session = _build_rpc_session()
+                provider = Web3.HTTPProvider(
+                    self.settings.ethereum_rpc_url,
+                    session=self.rpc_session,
+                    request_kwargs={"timeout": RPC_TIMEOUT}
+                )
+                # Retries are owned by the session adapter (see _build_rpc_session)
+                provider.middlewares = ()
+                self.web3 = Web3(provider)
                 
                 if not self.web3.is_connected():
                     self.logger.error("Failed to connect to Ethereum RPC")
                     return False
                     
+                self.multicall = self.web3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
                 self.logger.info(f"Connected to Ethereum RPC: {self.settings.ethereum_rpc_url}")
             else:
                 self.logger.error("Ethereum RPC URL not configured")
@@ -129,6 +151,8 @@ class TokenScannerService:
         """Shutdown the service and cleanup resources."""
         if self.http_client:
             await self.http_client.aclose()
+        if self.rpc_session:
+            self.rpc_session.close()
         self.logger.info("Token Scanner Service shutdown complete")
     
     def _get_cache_key(self, token_address: str, data_type: str) -> str:
@@ -178,33 +202,25 @@ class TokenScannerService:
         
         try:
             checksum_address = to_checksum_address(token_address)
-            contract = self.web3.eth.contract(address=checksum_address, abi=ERC20_ABI)
-            
-            # Get basic token information
-            name = "Unknown"
-            symbol = "UNKNOWN"
-            decimals = 18
-            total_supply = 0
+            # Get basic token information in a single eth_call through Multicall3;
+            # allowFailure keeps a reverting getter from failing the whole batch
+            calls = [(checksum_address, True, selector) for _, selector, _, _ in ERC20_BASIC_FIELDS]
+            results = self.multicall.functions.aggregate3(calls).call()
             
-            try:
-                name = contract.functions.name().call()
-            except (ContractLogicError, BadFunctionCallOutput, Exception):
-                self.logger.warning(f"Could not get name for token {token_address}")
-            
-            try:
-                symbol = contract.functions.symbol().call()
-            except (ContractLogicError, BadFunctionCallOutput, Exception):
-                self.logger.warning(f"Could not get symbol for token {token_address}")
-            
-            try:
-                decimals = contract.functions.decimals().call()
-            except (ContractLogicError, BadFunctionCallOutput, Exception):
-                self.logger.warning(f"Could not get decimals for token {token_address}")
+            values = {}
+            for (fn_name, _, output_type, default), (success, return_data) in zip(ERC20_BASIC_FIELDS, results):
+                try:
+                    if not success:
+                        raise ValueError(f"{fn_name}() reverted")
+                    values[fn_name] = abi_decode([output_type], return_data)[0]
+                except Exception:
+                    self.logger.warning(f"Could not get {fn_name} for token {token_address}")
+                    values[fn_name] = default
             
-            try:
-                total_supply = contract.functions.totalSupply().call()
-            except (ContractLogicError, BadFunctionCallOutput, Exception):
-                self.logger.warning(f"Could not get total supply for token {token_address}")
+            name = values["name"]
+            symbol = values["symbol"]
+            decimals = values["decimals"]
+            total_supply = values["totalSupply"]
             
             # Get deployment block (approximate age)
             deployment_block = await self._get_deployment_block(checksum_address)
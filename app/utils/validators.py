@@ -9,7 +9,7 @@ This module provides comprehensive validation functions for:
 import re
 from typing import List, Optional, Tuple
 from web3 import Web3
-from eth_utils import is_address, is_hex
+from eth_utils import is_address
 
 # Suspicious patterns for token names and symbols
 SUSPICIOUS_PATTERNS = [
@@ -46,11 +46,41 @@ SUSPICIOUS_PATTERNS = [
 # Compiled regex patterns for performance
 COMPILED_SUSPICIOUS_PATTERNS = [re.compile(pattern) for pattern in SUSPICIOUS_PATTERNS]
 
-# Valid Ethereum address pattern
-ETH_ADDRESS_PATTERN = re.compile(r'^0x[a-fA-F0-9]{40}$')
+# Valid Ethereum address pattern (\Z: unlike $, does not accept a trailing newline)
+ETH_ADDRESS_PATTERN = re.compile(r'^0x[a-fA-F0-9]{40}\Z')
 
 # Valid transaction hash pattern
-TX_HASH_PATTERN = re.compile(r'^0x[a-fA-F0-9]{64}$')
+TX_HASH_PATTERN = re.compile(r'^0x[a-fA-F0-9]{64}\Z')
+
+# Control and zero-width characters stripped from token names (str.translate table)
+_STRIPPED_CHARS_TABLE = dict.fromkeys(
+    [*range(0x00, 0x20), *range(0x7f, 0xa0), *range(0x200b, 0x2010), *range(0x2060, 0x2070)]
+)
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Token symbol character checks
+DIGIT_PATTERN = re.compile(r'\d')
+NON_ALNUM_PATTERN = re.compile(r'[^a-zA-Z0-9]')
+ALNUM_SYMBOL_PATTERN = re.compile(r'^[a-zA-Z0-9]+\Z')
+
+# Honeypot patterns for token names and symbols
+HONEYPOT_PATTERNS = [
+    r'(?i)\b(honey|pot|trap|lock|freeze)\b',
+    r'(?i)\b(no.?sell|cant.?sell|unable.?sell)\b',
+    r'(?i)\b(tax|fee).*100',
+    r'(?i)\b(burn|black.?hole|dead)\b'
+]
+
+COMPILED_HONEYPOT_PATTERNS = [re.compile(pattern) for pattern in HONEYPOT_PATTERNS]
+
+# EVM opcodes used when walking contract bytecode
+OPCODE_PUSH1 = 0x60
+OPCODE_PUSH32 = 0x7f
+OPCODE_DELEGATECALL = 0xf4
+
+# First bytes of the CBOR metadata map appended by solc (1 to 3 entries)
+CBOR_METADATA_MARKERS = (0xa1, 0xa2, 0xa3)
 
 def is_valid_ethereum_address(address: str) -> bool:
     """Validate Ethereum address format and checksum.
@@ -68,7 +98,12 @@ def is_valid_ethereum_address(address: str) -> bool:
     if not ETH_ADDRESS_PATTERN.match(address):
         return False
     
-    # Use Web3 for checksum validation
+    # Single-case addresses carry no checksum: the format check is enough
+    body = address[2:]
+    if body.islower() or body.isupper():
+        return True
+    
+    # Mixed case: use Web3 for checksum validation
     try:
         return is_address(address)
     except Exception:
@@ -86,15 +121,8 @@ def is_valid_transaction_hash(tx_hash: str) -> bool:
     if not tx_hash or not isinstance(tx_hash, str):
         return False
     
-    # Basic format check
-    if not TX_HASH_PATTERN.match(tx_hash):
-        return False
-    
-    # Additional hex validation
-    try:
-        return is_hex(tx_hash) and len(tx_hash) == 66  # 0x + 64 hex chars
-    except Exception:
-        return False
+    # Format check (0x + 64 hex chars) covers both hex and length validation
+    return TX_HASH_PATTERN.match(tx_hash) is not None
 
 def sanitize_token_name(name: str, max_length: int = 100) -> str:
     """Sanitize token name by removing suspicious characters and patterns.
@@ -110,10 +138,10 @@ def sanitize_token_name(name: str, max_length: int = 100) -> str:
         return "Unknown"
     
     # Remove zero-width and control characters
-    sanitized = re.sub(r'[\u0000-\u001f\u007f-\u009f\u200b-\u200f\u2060-\u206f]', '', name)
+    sanitized = name.translate(_STRIPPED_CHARS_TABLE)
     
     # Remove excessive whitespace
-    sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+    sanitized = WHITESPACE_PATTERN.sub(' ', sanitized).strip()
     
     # Truncate if too long
     if len(sanitized) > max_length:
@@ -189,11 +217,11 @@ def calculate_suspicion_score(name: str, symbol: str, description: str = "") ->
         score += 0.5
     
     # Numbers in symbol (unusual for legitimate tokens)
-    if re.search(r'\d', symbol):
+    if DIGIT_PATTERN.search(symbol):
         score += 1.0
     
     # Special characters in symbol
-    if re.search(r'[^a-zA-Z0-9]', symbol):
+    if NON_ALNUM_PATTERN.search(symbol):
         score += 1.5
     
     # Cap the score at 10.0
@@ -221,6 +249,41 @@ def is_contract_address(address: str, web3_instance: Optional[Web3] = None) -> b
     except Exception:
         return False
 
+def has_delegatecall_opcode(code: bytes) -> bool:
+    """Check whether EVM bytecode contains a DELEGATECALL instruction.
+    
+    The bytecode is walked opcode by opcode so that 0xf4 bytes inside PUSH
+    immediates or in the trailing solc metadata are not mistaken for the
+    instruction.
+    
+    Args:
+        code: Runtime bytecode
+    
+    Returns:
+        True if a DELEGATECALL opcode is found, False otherwise
+    """
+    # Fast path: no 0xf4 byte at all
+    if bytes([OPCODE_DELEGATECALL]) not in code:
+        return False
+    
+    # Strip the solc CBOR metadata, whose length is stored in the last two bytes
+    if len(code) >= 2:
+        metadata_length = int.from_bytes(code[-2:], "big") + 2
+        if metadata_length < len(code) and code[-metadata_length] in CBOR_METADATA_MARKERS:
+            code = code[:-metadata_length]
+    
+    i = 0
+    code_length = len(code)
+    while i < code_length:
+        opcode = code[i]
+        if opcode == OPCODE_DELEGATECALL:
+            return True
+        if OPCODE_PUSH1 <= opcode <= OPCODE_PUSH32:
+            i += opcode - OPCODE_PUSH1 + 1  # skip the push immediate
+        i += 1
+    
+    return False
+
 def validate_token_metadata(name: str, symbol: str, decimals: int) -> Tuple[bool, List[str]]:
     """Validate token metadata for basic sanity checks.
     
@@ -245,7 +308,7 @@ def validate_token_metadata(name: str, symbol: str, decimals: int) -> Tuple[bool
         errors.append("Token symbol is empty")
     elif len(symbol) > 20:
         errors.append("Token symbol is too long")
-    elif not re.match(r'^[a-zA-Z0-9]+$', symbol):
+    elif not ALNUM_SYMBOL_PATTERN.match(symbol):
         errors.append("Token symbol contains invalid characters")
     
     # Validate decimals
@@ -289,20 +352,9 @@ def is_honeypot_pattern(name: str, symbol: str) -> bool:
     Returns:
         True if honeypot patterns detected
     """
-    honeypot_patterns = [
-        r'(?i)\b(honey|pot|trap|lock|freeze)\b',
-        r'(?i)\b(no.?sell|cant.?sell|unable.?sell)\b',
-        r'(?i)\b(tax|fee).*100',
-        r'(?i)\b(burn|black.?hole|dead)\b'
-    ]
-    
     text = f"{name} {symbol}".lower()
     
-    for pattern in honeypot_patterns:
-        if re.search(pattern, text):
-            return True
-    
-    return False
+    return any(pattern.search(text) for pattern in COMPILED_HONEYPOT_PATTERNS)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -10,22 +10,125 @@ Version: 1.0.0
 """
 
 import asyncio
+import itertools
 import json
 import logging
-from typing import Optional, Dict, Any, Callable
+import time
+from collections import OrderedDict, deque
+from typing import Optional, Dict, Any, Callable, Deque, List, Set
 from datetime import datetime
 
+import aiohttp
 import websockets
 from websockets.exceptions import ConnectionClosed, InvalidStatusCode
-from web3 import Web3
-from web3.exceptions import ContractLogicError
+from eth_abi import decode as abi_decode, encode as abi_encode
+from eth_utils import function_signature_to_4byte_selector
 
-from app.config import settings, ERC20_ABI
+from app.config import settings, MULTICALL3_ADDRESS
 from app.models import TokenInfo, TokenSource, WebSocketMessage
 from app.utils.logger import setup_logger
+from app.utils.validators import has_delegatecall_opcode
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
 
 logger = setup_logger(__name__)
 
+# Extension C de websockets (masquage/framing), disponible avec les wheels officielles
+try:
+    from websockets import speedups  # noqa: F401
+except ImportError:
+    logger.warning("⚠️ websockets.speedups indisponible: framing en Python pur")
+
+# Sélecteurs calculés une seule fois à l'import (aucun objet Contract ni parsing d'ABI
+# par candidat): les fonctions ERC20 sans argument se réduisent à leur sélecteur
+ERC20_PROBE_CALLS = [
+    (fn_name, function_signature_to_4byte_selector(f"{fn_name}()"), output_type)
+    for fn_name, output_type in (
+        ("name", "string"),
+        ("symbol", "string"),
+        ("decimals", "uint8"),
+        ("totalSupply", "uint256"),
+    )
+]
+AGGREGATE3_SELECTOR = function_signature_to_4byte_selector("aggregate3((address,bool,bytes)[])")
+
+# Sélecteurs que le dispatcher d'un ERC20 embarque (PUSH4) dans son bytecode
+ERC20_CODE_SELECTORS = tuple(selector for _, selector, _ in ERC20_PROBE_CALLS)
+
+# Proxies (clones EIP-1167, proxies upgradeables) délèguent au code d'implémentation:
+# leur bytecode ne contient pas les sélecteurs, le pré-filtre ne s'applique pas
+EIP1167_CLONE_PREFIX = bytes.fromhex("363d3d373d3d3d363d73")
+
+# Délai maximal accordé à un endpoint HTTP pour répondre au probe de démarrage
+PROVIDER_PROBE_TIMEOUT = 2.0
+
+JSON_RPC_HEADERS = {"Content-Type": "application/json"}
+
+# Délai maximal d'un appel JSON-RPC HTTP (la valeur par défaut d'aiohttp est de 5 minutes)
+RPC_REQUEST_TIMEOUT = 10.0
+
+# Payloads de souscription statiques, sérialisés une seule fois. Gardés en str
+# pour être envoyés en frames texte (attendues par les fournisseurs JSON-RPC)
+_SUB_NEW_HEADS = json.dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "eth_subscribe",
+    "params": ["newHeads"]
+})
+_SUB_PENDING_TXS = json.dumps({
+    "jsonrpc": "2.0",
+    "id": 2,
+    "method": "eth_subscribe",
+    "params": ["newPendingTransactions"]
+})
+
+# Racine d'un trie vide: transactionsRoot d'un bloc sans aucune transaction
+EMPTY_TRIE_ROOT = "0x56e81f171bcc55a6ff8345e692c0f86e5b48e01b996cadc001622fb5e363b421"
+
+# Tentatives (avec backoff exponentiel) si un nœud n'a pas encore indexé les reçus du bloc
+RECEIPTS_FETCH_ATTEMPTS = 3
+RECEIPTS_RETRY_BASE_DELAY = 0.25
+
+# Blocs aux reçus indisponibles: retentés aux notifications suivantes (nombre de
+# notifications avant abandon, et nombre maximal de blocs en attente)
+PENDING_BLOCK_RETRIES = 3
+MAX_PENDING_BLOCKS = 16
+
+# Frames WebSocket en attente de décodage avant de suspendre la lecture du socket
+FRAME_QUEUE_SIZE = 256
+
+# File pleine: intervalle de vérification de l'arrêt par le lecteur du socket
+FRAME_PUT_TIMEOUT = 1.0
+
+# Délai accordé au consommateur pour vider les frames reçues lors de l'arrêt
+FRAME_DRAIN_TIMEOUT = 5.0
+
+# Nombre d'adresses de tokens mémorisées en LRU pour éviter les doublons
+SEEN_TOKENS_CACHE_SIZE = 100_000
+
+
+def _is_provider_failure(error: Exception) -> bool:
+    """Indique si l'erreur est imputable à l'endpoint HTTP (réseau, timeout, 429/5xx)."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def _is_contract_creation(transaction: Dict[str, Any]) -> bool:
+    """Vérifie si une transaction est une création de contrat."""
+    # `to` est renseigné pour la quasi-totalité des transactions: on évite
+    # alors de toucher au champ `input`, potentiellement volumineux
+    if transaction.get("to") is not None:
+        return False
+    tx_input = transaction.get("input")
+    return tx_input is not None and len(tx_input) > 2
+
 
 class EthereumWebSocketListener:
     """Écouteur WebSocket pour les nouveaux contrats Ethereum."""
@@ -37,38 +140,130 @@ class EthereumWebSocketListener:
         self.db = db
         
         self.websocket: Optional[websockets.WebSocketServerProtocol] = None
-        self.web3: Optional[Web3] = None
+        self.http_url: Optional[str] = None
+        self._fallback_http_urls: Deque[str] = deque()
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._rpc_ids = itertools.count(1)
         self.is_running = False
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = settings.MAX_RECONNECT_ATTEMPTS
         self.reconnect_delay = settings.WEBSOCKET_RECONNECT_DELAY
         
+        # Frames reçues, décodées et dispatchées par une tâche dédiée
+        self._frame_queue: asyncio.Queue = asyncio.Queue(maxsize=FRAME_QUEUE_SIZE)
+        self._frame_consumer: Optional[asyncio.Task] = None
+        
+        # Sondes ERC20 des blocs en cours, bornées globalement par un sémaphore partagé
+        self._probe_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_ANALYSES)
+        self._block_scans: Set[asyncio.Task] = set()
+        
+        # File bornée des tokens à analyser, consommée par un pool fixe de workers
+        self._analysis_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.MAX_CONCURRENT_ANALYSES * 4)
+        self._analysis_workers: List[asyncio.Task] = []
+        
+        # LRU des adresses de tokens déjà vues, devant token_exists (clé en minuscules)
+        self._seen_tokens: "OrderedDict[str, None]" = OrderedDict()
+        
         # Statistiques
         self.messages_received = 0
         self.contracts_detected = 0
         self.tokens_processed = 0
         self.last_block_number = 0
+        self._last_block_hash: Optional[str] = None
+        self._pending_blocks: Dict[int, int] = {}  # numéro -> tentatives restantes
         self.start_time = datetime.utcnow()
+        self._start_monotonic = time.monotonic()
         
-        # Initialisation Web3 pour les appels HTTP
-        self._init_web3()
+        # Endpoint HTTP par défaut (affiné par _select_http_provider au démarrage)
+        self._init_http_url()
     
-    def _init_web3(self):
-        """Initialise la connexion Web3 HTTP."""
+    def _init_http_url(self):
+        """Initialise l'endpoint HTTP JSON-RPC par défaut (sans appel RPC)."""
         try:
-            self.web3 = Web3(Web3.HTTPProvider(settings.ethereum_http_url))
-            if self.web3.is_connected():
-                logger.info("🌐 Connexion Web3 HTTP établie")
-            else:
-                logger.error("❌ Impossible de se connecter à Web3 HTTP")
+            self.http_url = settings.ethereum_http_url
         except Exception as e:
             logger.error(f"Erreur lors de l'initialisation Web3: {e}")
     
+    async def _probe_http_provider(self, session: aiohttp.ClientSession, url: str) -> Optional[float]:
+        """Mesure la latence d'un endpoint HTTP via web3_clientVersion."""
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "web3_clientVersion", "params": []}
+        
+        async def _client_version() -> Dict[str, Any]:
+            async with session.post(url, json=payload) as response:
+                response.raise_for_status()
+                return await response.json()
+        
+        start = time.perf_counter()
+        try:
+            data = await asyncio.wait_for(_client_version(), timeout=PROVIDER_PROBE_TIMEOUT)
+            if "result" not in data:
+                return None
+            return time.perf_counter() - start
+        except Exception as e:
+            logger.debug(f"Endpoint Web3 HTTP rejeté: {e}")
+            return None
+    
+    async def _select_http_provider(self) -> bool:
+        """Sonde les endpoints HTTP en parallèle et retient le plus rapide."""
+        try:
+            urls: List[str] = settings.ethereum_http_urls
+        except ValueError as e:
+            logger.error(f"Erreur lors de l'initialisation Web3: {e}")
+            return False
+        
+        latencies = await asyncio.gather(
+            *[self._probe_http_provider(self._http_session, url) for url in urls]
+        )
+        
+        ranked = sorted(
+            (latency, url) for latency, url in zip(latencies, urls) if latency is not None
+        )
+        if not ranked:
+            logger.error("❌ Impossible de se connecter à Web3 HTTP")
+            return False
+        
+        best_latency, self.http_url = ranked[0]
+        self._fallback_http_urls = deque(url for _, url in ranked[1:])
+        
+        logger.info(
+            f"🌐 Connexion Web3 HTTP établie ({best_latency * 1000:.0f} ms, "
+            f"{len(self._fallback_http_urls)} endpoint(s) de secours)"
+        )
+        return True
+    
+    def _failover_http_provider(self, failed_url: str):
+        """Bascule sur le prochain endpoint HTTP de secours."""
+        # Un autre appel concurrent a déjà basculé suite à la même panne
+        if not self._fallback_http_urls or failed_url != self.http_url:
+            return
+        
+        self._fallback_http_urls.append(self.http_url)
+        self.http_url = self._fallback_http_urls.popleft()
+        logger.warning("🔀 Bascule sur un endpoint Web3 HTTP de secours")
+    
     async def start(self):
         """Démarre l'écoute WebSocket avec reconnexion automatique."""
         self.is_running = True
         logger.info("🚀 Démarrage de l'écouteur WebSocket Ethereum...")
         
+        # Session HTTP keep-alive partagée par tous les appels JSON-RPC
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=RPC_REQUEST_TIMEOUT)
+            )
+        
+        await self._select_http_provider()
+        
+        if not self._analysis_workers:
+            self._analysis_workers = [
+                asyncio.create_task(self._analysis_worker())
+                for _ in range(settings.MAX_CONCURRENT_ANALYSES)
+            ]
+        
+        if self._frame_consumer is None or self._frame_consumer.done():
+            self._frame_consumer = asyncio.create_task(self._consume_frames())
+        
         while self.is_running:
             try:
                 await self._connect_and_listen()
@@ -89,8 +284,66 @@ class EthereumWebSocketListener:
         self.is_running = False
         if self.websocket:
             await self.websocket.close()
+        if self._frame_consumer:
+            # Sentinelle: le consommateur termine les frames déjà reçues puis s'arrête,
+            # dans la limite de FRAME_DRAIN_TIMEOUT (au-delà, il est annulé)
+            try:
+                self._frame_queue.put_nowait(None)
+                await asyncio.wait_for(self._frame_consumer, timeout=FRAME_DRAIN_TIMEOUT)
+            except (asyncio.QueueFull, asyncio.TimeoutError):
+                self._frame_consumer.cancel()
+            await asyncio.gather(self._frame_consumer, return_exceptions=True)
+            self._frame_consumer = None
+            
+            # Frames non traitées (et sentinelle éventuelle) abandonnées
+            while not self._frame_queue.empty():
+                self._frame_queue.get_nowait()
+        for scan in self._block_scans:
+            scan.cancel()
+        await asyncio.gather(*self._block_scans, return_exceptions=True)
+        for worker in self._analysis_workers:
+            worker.cancel()
+        await asyncio.gather(*self._analysis_workers, return_exceptions=True)
+        self._analysis_workers = []
+        if self._http_session:
+            await self._http_session.close()
         logger.info("🛑 Écouteur WebSocket arrêté")
     
+    async def _rpc(self, method: str, params: List[Any]) -> Any:
+        """Effectue un appel JSON-RPC HTTP sans bloquer la boucle d'événements."""
+        if not self._http_session or not self.http_url:
+            raise RuntimeError("Session HTTP JSON-RPC non initialisée")
+        
+        payload = _dumps({
+            "jsonrpc": "2.0",
+            "id": next(self._rpc_ids),
+            "method": method,
+            "params": params
+        })
+        
+        url = self.http_url
+        try:
+            data = await self._post_rpc(url, payload)
+        except Exception as e:
+            if not _is_provider_failure(e) or not self._fallback_http_urls:
+                raise
+            
+            # Endpoint en panne: bascule sur le secours puis une seule nouvelle tentative
+            logger.warning(f"Échec JSON-RPC {method} sur l'endpoint courant: {e!r}")
+            self._failover_http_provider(url)
+            data = await self._post_rpc(self.http_url, payload)
+        
+        if "error" in data:
+            raise RuntimeError(f"Erreur JSON-RPC {method}: {data['error']}")
+        
+        return data.get("result")
+    
+    async def _post_rpc(self, url: str, payload: Any) -> Dict[str, Any]:
+        """Envoie une requête JSON-RPC déjà sérialisée et décode la réponse."""
+        async with self._http_session.post(url, data=payload, headers=JSON_RPC_HEADERS) as response:
+            response.raise_for_status()
+            return _loads(await response.read())
+    
     def is_connected(self) -> bool:
         """Vérifie si le WebSocket est connecté."""
         return self.websocket is not None and not self.websocket.closed
@@ -104,7 +357,10 @@ class EthereumWebSocketListener:
                 settings.ethereum_websocket_url,
                 ping_interval=20,
                 ping_timeout=10,
-                close_timeout=10
+                close_timeout=10,
+                compression=None,  # pas de permessage-deflate: évite le zlib par frame
+                max_size=2 ** 24,
+                read_limit=2 ** 20
             ) as websocket:
                 self.websocket = websocket
                 self.reconnect_attempts = 0
@@ -118,9 +374,11 @@ class EthereumWebSocketListener:
                 
                 logger.info("✅ WebSocket connecté et souscriptions actives")
                 
-                # Écoute des messages
+                # Écoute des messages: la lecture du socket ne fait qu'empiler les
+                # frames, le décodage et le dispatch se font dans _consume_frames
                 async for message in websocket:
-                    await self._handle_message(message)
+                    if not await self._enqueue_frame(message):
+                        break
                     
         except ConnectionClosed:
             logger.warning("🔌 Connexion WebSocket fermée")
@@ -132,33 +390,45 @@ class EthereumWebSocketListener:
     
     async def _subscribe_to_new_blocks(self):
         """Souscrit aux nouveaux blocs pour détecter les contrats."""
-        subscription = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "eth_subscribe",
-            "params": ["newHeads"]
-        }
-        
-        await self.websocket.send(json.dumps(subscription))
+        await self.websocket.send(_SUB_NEW_HEADS)
         logger.info("📦 Souscription aux nouveaux blocs activée")
     
     async def _subscribe_to_pending_transactions(self):
         """Souscrit aux transactions en attente (mode debug)."""
-        subscription = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "eth_subscribe",
-            "params": ["newPendingTransactions"]
-        }
-        
-        await self.websocket.send(json.dumps(subscription))
+        await self.websocket.send(_SUB_PENDING_TXS)
         logger.info("⏳ Souscription aux transactions en attente activée")
     
+    async def _enqueue_frame(self, message: Any) -> bool:
+        """Empile une frame reçue; renvoie False si l'écouteur s'arrête pendant l'attente."""
+        try:
+            self._frame_queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            pass
+        
+        # File pleine: attente bornée pour ne pas bloquer l'arrêt de l'écouteur
+        while self.is_running:
+            try:
+                await asyncio.wait_for(self._frame_queue.put(message), timeout=FRAME_PUT_TIMEOUT)
+                return True
+            except asyncio.TimeoutError:
+                continue
+        return False
+    
+    async def _consume_frames(self):
+        """Décode et dispatche les frames reçues jusqu'à la sentinelle None."""
+        while True:
+            message = await self._frame_queue.get()
+            if message is None:
+                break
+            await self._handle_message(message)
+    
     async def _handle_message(self, message: str):
         """Traite un message WebSocket reçu."""
         try:
             self.messages_received += 1
-            data = json.loads(message)
+            # orjson accepte directement les frames bytes (pas de decode utf-8)
+            data = _loads(message)
             
             # Ignorer les messages de confirmation de souscription
             if "result" in data and isinstance(data.get("result"), str):
@@ -169,7 +439,7 @@ class EthereumWebSocketListener:
             if "params" in data and "result" in data["params"]:
                 await self._process_notification(data["params"]["result"])
                 
-        except json.JSONDecodeError:
+        except json.JSONDecodeError:  # orjson.JSONDecodeError en hérite
             logger.error(f"Message JSON invalide: {message[:100]}...")
         except Exception as e:
             logger.error(f"Erreur lors du traitement du message: {e}")
@@ -192,19 +462,71 @@ class EthereumWebSocketListener:
         """Traite un nouveau bloc pour détecter les contrats."""
         try:
             block_number = int(block_data["number"], 16)
-            self.last_block_number = block_number
+            block_hash = block_data.get("hash")
+            
+            # Notification rejouée (reconnexion, aléa du fournisseur): déjà traitée. La
+            # comparaison porte sur le hash: un bloc de remplacement (re-org) a le même
+            # numéro mais un hash différent et doit être traité
+            if block_hash is not None and block_hash == self._last_block_hash:
+                return
             
             logger.debug(f"📦 Nouveau bloc: {block_number}")
             
-            # Récupérer les détails du bloc avec les transactions
-            block_details = await self._get_block_with_transactions(block_number)
+            if self._pending_blocks:
+                await self._retry_pending_blocks()
+            
+            # Bloc vide: aucun reçu à récupérer
+            if block_data.get("transactionsRoot") == EMPTY_TRIE_ROOT:
+                self._mark_block_processed(block_number, block_hash)
+                return
+            
+            # Récupérer tous les reçus du bloc (contractAddress inclus) en un seul appel
+            receipts = await self._get_block_receipts(block_number)
+            
+            # Reçus indisponibles: newHeads ne renverra pas ce bloc, il est donc mis en
+            # attente et retenté lors des notifications suivantes
+            if receipts is None:
+                self._defer_block(block_number)
+                return
+            self._mark_block_processed(block_number, block_hash)
             
-            if block_details and "transactions" in block_details:
-                await self._scan_block_transactions(block_details["transactions"])
+            if receipts:
+                await self._scan_block_receipts(receipts)
                 
         except Exception as e:
             logger.error(f"Erreur lors du traitement du bloc: {e}")
     
+    def _mark_block_processed(self, block_number: int, block_hash: Optional[str]):
+        """Enregistre le dernier bloc dont les reçus ont été récupérés."""
+        self.last_block_number = block_number
+        self._last_block_hash = block_hash
+    
+    def _defer_block(self, block_number: int):
+        """Met en attente un bloc dont les reçus n'ont pas pu être récupérés."""
+        if block_number not in self._pending_blocks and len(self._pending_blocks) >= MAX_PENDING_BLOCKS:
+            oldest = next(iter(self._pending_blocks))
+            del self._pending_blocks[oldest]
+            logger.warning(f"⚠️ Bloc {oldest} ignoré: trop de blocs en attente")
+        
+        self._pending_blocks[block_number] = PENDING_BLOCK_RETRIES
+        logger.warning(f"⏳ Bloc {block_number} mis en attente: reçus indisponibles")
+    
+    async def _retry_pending_blocks(self):
+        """Retente la récupération des reçus des blocs mis en attente."""
+        for block_number, attempts_left in list(self._pending_blocks.items()):
+            receipts = await self._get_block_receipts(block_number)
+            
+            if receipts is not None:
+                del self._pending_blocks[block_number]
+                logger.info(f"✅ Reçus du bloc {block_number} récupérés après mise en attente")
+                if receipts:
+                    await self._scan_block_receipts(receipts)
+            elif attempts_left <= 1:
+                del self._pending_blocks[block_number]
+                logger.warning(f"⚠️ Bloc {block_number} ignoré: reçus toujours indisponibles")
+            else:
+                self._pending_blocks[block_number] = attempts_left - 1
+    
     async def _process_pending_transaction(self, tx_hash: str):
         """Traite une transaction en attente (mode debug uniquement)."""
         try:
@@ -214,20 +536,26 @@ class EthereumWebSocketListener:
             # Récupérer les détails de la transaction
             tx_details = await self._get_transaction_details(tx_hash)
             
-            if tx_details and self._is_contract_creation(tx_details):
+            if tx_details and _is_contract_creation(tx_details):
                 logger.debug(f"🔍 Transaction de création de contrat détectée: {tx_hash}")
                 
         except Exception as e:
             logger.error(f"Erreur lors du traitement de la transaction en attente: {e}")
     
-    async def _get_block_with_transactions(self, block_number: int) -> Optional[Dict[str, Any]]:
-        """Récupère un bloc avec ses transactions."""
+    async def _get_block_receipts(self, block_number: int) -> Optional[List[Dict[str, Any]]]:
+        """Récupère l'ensemble des reçus d'un bloc."""
         try:
-            if not self.web3:
-                return None
+            for attempt in range(RECEIPTS_FETCH_ATTEMPTS):
+                receipts = await self._rpc("eth_getBlockReceipts", [hex(block_number)])
+                if receipts is not None:
+                    return receipts
+                
+                # Le nœud interrogé peut être légèrement en retard sur la notification newHeads
+                if attempt < RECEIPTS_FETCH_ATTEMPTS - 1:
+                    await asyncio.sleep(RECEIPTS_RETRY_BASE_DELAY * 2 ** attempt)
             
-            block = self.web3.eth.get_block(block_number, full_transactions=True)
-            return dict(block)
+            logger.warning(f"Reçus indisponibles pour le bloc {block_number}")
+            return None
             
         except Exception as e:
             logger.error(f"Erreur lors de la récupération du bloc {block_number}: {e}")
@@ -236,141 +564,160 @@ class EthereumWebSocketListener:
     async def _get_transaction_details(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         """Récupère les détails d'une transaction."""
         try:
-            if not self.web3:
-                return None
-            
-            tx = self.web3.eth.get_transaction(tx_hash)
-            return dict(tx)
+            return await self._rpc("eth_getTransactionByHash", [tx_hash])
             
         except Exception as e:
             logger.error(f"Erreur lors de la récupération de la transaction {tx_hash}: {e}")
             return None
     
-    async def _scan_block_transactions(self, transactions: list):
-        """Scanne les transactions d'un bloc pour détecter les créations de contrats."""
-        contract_creations = []
-        
-        for tx in transactions:
-            if self._is_contract_creation(tx):
-                contract_creations.append(tx)
+    async def _scan_block_receipts(self, receipts: List[Dict[str, Any]]):
+        """Scanne les reçus d'un bloc pour détecter les contrats déployés avec succès."""
+        contract_creations = [
+            receipt for receipt in receipts
+            if receipt.get("contractAddress") is not None and receipt.get("status") == "0x1"
+        ]
         
         if contract_creations:
             logger.info(f"🏭 {len(contract_creations)} création(s) de contrat détectée(s)")
             
-            # Traiter les créations de contrats en parallèle (limité)
-            semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_ANALYSES)
-            tasks = [
-                self._process_contract_creation(tx, semaphore)
-                for tx in contract_creations
-            ]
-            
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # Sondes lancées en arrière-plan: le bloc suivant n'attend pas la plus lente
+            task = asyncio.create_task(self._probe_contract_creations(contract_creations))
+            self._block_scans.add(task)
+            task.add_done_callback(self._block_scans.discard)
     
-    def _is_contract_creation(self, transaction: Dict[str, Any]) -> bool:
-        """Vérifie si une transaction est une création de contrat."""
-        return (
-            transaction.get("to") is None and
-            transaction.get("input") is not None and
-            len(transaction.get("input", "")) > 2
-        )
+    async def _probe_contract_creations(self, contract_creations: List[Dict[str, Any]]):
+        """Sonde en parallèle (limité) les contrats déployés dans un bloc."""
+        # TaskGroup annule proprement les sondes restantes si l'écouteur est arrêté;
+        # _process_contract_creation journalise ses erreurs sans les propager
+        async with asyncio.TaskGroup() as tg:
+            for receipt in contract_creations:
+                tg.create_task(self._process_contract_creation(receipt, self._probe_semaphore))
     
-    async def _process_contract_creation(self, transaction: Dict[str, Any], semaphore: asyncio.Semaphore):
-        """Traite une création de contrat potentielle."""
+    async def _process_contract_creation(self, receipt: Dict[str, Any], semaphore: asyncio.Semaphore):
+        """Traite une création de contrat potentielle à partir de son reçu."""
         async with semaphore:
             try:
                 self.contracts_detected += 1
-                tx_hash = transaction["hash"].hex() if hasattr(transaction["hash"], 'hex') else transaction["hash"]
-                
-                logger.debug(f"🔍 Analyse de la création de contrat: {tx_hash}")
+                contract_address = receipt["contractAddress"]
                 
-                # Attendre que la transaction soit minée
-                await asyncio.sleep(2)
+                logger.debug(f"🔍 Analyse de la création de contrat: {contract_address}")
                 
-                # Récupérer le reçu de transaction pour obtenir l'adresse du contrat
-                receipt = await self._get_transaction_receipt(tx_hash)
-                
-                if receipt and receipt.get("contractAddress"):
-                    contract_address = receipt["contractAddress"]
+                # Vérifier si c'est un token ERC20 (pré-filtre bytecode avant le multicall)
+                if (
+                    await self._looks_like_erc20(contract_address) and
+                    await self._is_erc20_token(contract_address)
+                ):
+                    await self._handle_new_erc20_token(contract_address, receipt)
                     
-                    # Vérifier si c'est un token ERC20
-                    if await self._is_erc20_token(contract_address):
-                        await self._handle_new_erc20_token(contract_address, transaction)
-                        
             except Exception as e:
                 logger.error(f"Erreur lors du traitement de la création de contrat: {e}")
     
-    async def _get_transaction_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
-        """Récupère le reçu d'une transaction."""
+    async def _looks_like_erc20(self, contract_address: str) -> bool:
+        """Pré-filtre: vérifie que le bytecode contient les sélecteurs ERC20 (un seul eth_getCode).
+        
+        Les proxies passent toujours le pré-filtre: seul le contrat d'implémentation
+        porte les sélecteurs.
+        """
         try:
-            if not self.web3:
-                return None
+            code_hex = await self._rpc("eth_getCode", [contract_address, "latest"])
+            if not code_hex or len(code_hex) <= 2:
+                return False
             
-            receipt = self.web3.eth.get_transaction_receipt(tx_hash)
-            return dict(receipt)
+            # Recherche sur les octets bruts plutôt que sur la chaîne hexadécimale
+            code = bytes.fromhex(code_hex[2:])
             
+            # Proxy: impossible de conclure sur le bytecode, on laisse le multicall trancher
+            if code.startswith(EIP1167_CLONE_PREFIX) or has_delegatecall_opcode(code):
+                return True
+            
+            return all(code.find(selector) != -1 for selector in ERC20_CODE_SELECTORS)
+        
         except Exception as e:
-            logger.debug(f"Reçu de transaction non disponible pour {tx_hash}: {e}")
-            return None
+            logger.debug(f"Erreur lors de la lecture du bytecode de {contract_address}: {e}")
+            return False
     
     async def _is_erc20_token(self, contract_address: str) -> bool:
-        """Vérifie si un contrat est un token ERC20."""
+        """Vérifie si un contrat est un token ERC20 (un seul eth_call via Multicall3)."""
         try:
-            if not self.web3:
-                return False
+            calls = [(contract_address, True, calldata) for _, calldata, _ in ERC20_PROBE_CALLS]
+            calldata = AGGREGATE3_SELECTOR + abi_encode(["(address,bool,bytes)[]"], [calls])
             
-            contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(contract_address),
-                abi=ERC20_ABI
-            )
+            # name/symbol/decimals/totalSupply en un seul aller-retour RPC
+            result = await self._rpc("eth_call", [
+                {"to": MULTICALL3_ADDRESS, "data": "0x" + calldata.hex()},
+                "latest"
+            ])
+            (results,) = abi_decode(["(bool,bytes)[]"], bytes.fromhex(result[2:]))
             
-            # Tenter d'appeler les fonctions ERC20 de base
-            try:
-                name = contract.functions.name().call()
-                symbol = contract.functions.symbol().call()
-                decimals = contract.functions.decimals().call()
-                total_supply = contract.functions.totalSupply().call()
-                
-                # Vérifications de base
-                return (
-                    isinstance(name, str) and len(name) > 0 and
-                    isinstance(symbol, str) and len(symbol) > 0 and
-                    isinstance(decimals, int) and 0 <= decimals <= 18 and
-                    isinstance(total_supply, int) and total_supply > 0
-                )
-                
-            except ContractLogicError:
-                return False
+            values = []
+            for (success, return_data), (_, _, output_type) in zip(results, ERC20_PROBE_CALLS):
+                if not success:
+                    return False
+                values.append(abi_decode([output_type], return_data)[0])
+            
+            name, symbol, decimals, total_supply = values
+            
+            # Vérifications de base
+            return (
+                isinstance(name, str) and len(name) > 0 and
+                isinstance(symbol, str) and len(symbol) > 0 and
+                isinstance(decimals, int) and 0 <= decimals <= 18 and
+                isinstance(total_supply, int) and total_supply > 0
+            )
                 
         except Exception as e:
             logger.debug(f"Erreur lors de la vérification ERC20 pour {contract_address}: {e}")
             return False
     
-    async def _handle_new_erc20_token(self, contract_address: str, transaction: Dict[str, Any]):
+    def _already_seen(self, contract_address: str) -> bool:
+        """Indique si l'adresse a déjà été vue, et la mémorise sinon (LRU borné)."""
+        key = contract_address.lower()
+        if key in self._seen_tokens:
+            self._seen_tokens.move_to_end(key)
+            return True
+        
+        self._seen_tokens[key] = None
+        if len(self._seen_tokens) > SEEN_TOKENS_CACHE_SIZE:
+            self._seen_tokens.popitem(last=False)
+        return False
+    
+    async def _handle_new_erc20_token(self, contract_address: str, receipt: Dict[str, Any]):
         """Traite un nouveau token ERC20 détecté."""
         try:
             self.tokens_processed += 1
             
             logger.info(f"🪙 Nouveau token ERC20 détecté: {contract_address}")
             
-            # Vérifier si le token existe déjà
-            if await self.db.token_exists(contract_address):
+            # Vérifier si le token existe déjà: la base ne fait autorité que pour les
+            # adresses déjà vues, une adresse inconnue du LRU évite l'aller-retour
+            if self._already_seen(contract_address) and await self.db.token_exists(contract_address):
                 logger.debug(f"Token déjà en base: {contract_address}")
                 return
             
             # Créer les informations de base du token
+            block_number = receipt.get("blockNumber")
             token_info = TokenInfo(
                 contract_address=contract_address,
                 source=TokenSource.ETHEREUM_WEBSOCKET,
-                creation_block=transaction.get("blockNumber"),
+                creation_block=int(block_number, 16) if block_number else None,
                 creation_timestamp=datetime.utcnow()
             )
             
-            # Lancer l'analyse complète en arrière-plan
-            asyncio.create_task(self._analyze_token_async(token_info))
+            # Mettre en file l'analyse complète (bloque si les workers sont saturés)
+            await self._analysis_queue.put(token_info)
             
         except Exception as e:
             logger.error(f"Erreur lors du traitement du nouveau token {contract_address}: {e}")
     
+    async def _analysis_worker(self):
+        """Consomme la file d'analyse jusqu'à l'annulation du worker."""
+        while True:
+            token_info = await self._analysis_queue.get()
+            try:
+                await self._analyze_token_async(token_info)
+            finally:
+                self._analysis_queue.task_done()
+    
     async def _analyze_token_async(self, token_info: TokenInfo):
         """Analyse complète d'un token en arrière-plan."""
         try:
@@ -400,7 +747,7 @@ class EthereumWebSocketListener:
     
     def get_stats(self) -> Dict[str, Any]:
         """Récupère les statistiques de l'écouteur."""
-        uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        uptime = time.monotonic() - self._start_monotonic
         
         return {
             "is_connected": self.is_connected(),
@@ -411,5 +758,5 @@ class EthereumWebSocketListener:
             "tokens_processed": self.tokens_processed,
             "last_block_number": self.last_block_number,
             "reconnect_attempts": self.reconnect_attempts,
-            "messages_per_minute": round((self.messages_received / uptime) * 60, 2) if uptime > 0 else 0
+            "messages_per_minute": int(self.messages_received * 60 / uptime) if uptime > 0 else 0
         }
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""Tests for app.utils.validators."""
+
+from app.utils.validators import has_delegatecall_opcode
+
+# EIP-1167 minimal proxy runtime code (GAS DELEGATECALL = 5a f4)
+EIP1167_CLONE = bytes.fromhex(
+    "363d3d373d3d3d363d73"
+    "bebebebebebebebebebebebebebebebebebebebe"
+    "5af43d82803e903d91602b57fd5bf3"
+)
+
+
+def test_delegatecall_opcode_detected():
+    assert has_delegatecall_opcode(EIP1167_CLONE)
+
+
+def test_f4_in_push_data_is_not_delegatecall():
+    # PUSH1 0x80 PUSH1 0x40 MSTORE PUSH4 0xf4f4f4f4 PUSH32 0xf4...f4 STOP
+    code = bytes.fromhex("6080604052" + "63f4f4f4f4" + "7f" + "f4" * 32 + "00")
+    assert not has_delegatecall_opcode(code)
+
+
+def test_f4_in_solc_metadata_is_not_delegatecall():
+    # STOP, then a CBOR map (a2 ...) containing 0xf4, then its 2-byte length
+    metadata = bytes.fromhex("a264697066735822") + b"\xf4" * 34
+    code = bytes.fromhex("6080604052fe") + metadata + len(metadata).to_bytes(2, "big")
+    assert not has_delegatecall_opcode(code)
+
+
+def test_code_without_f4_byte():
+    assert not has_delegatecall_opcode(bytes.fromhex("6080604052600080fd"))
+    assert not has_delegatecall_opcode(b"")